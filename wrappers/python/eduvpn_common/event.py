@@ -1,10 +1,17 @@
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List
 
 from eduvpn_common.state import State, StateType
 
 # The attribute that callback functions get
 EDUVPN_CALLBACK_PROPERTY = "_eduvpn_property_callback"
 
+# The state types as plain integers, these are looked up for every event that is ran
+STATE_TYPE_ENTER = int(StateType.ENTER)
+STATE_TYPE_LEAVE = int(StateType.LEAVE)
+
+# The states by their integer value, used to convert the states from Go without going through State(...)
+STATES = {int(state): state for state in State}
+
 
 def class_state_transition(state: int, state_type: StateType) -> Callable:
     """A decorator to be internally by classes to register the event
@@ -23,11 +30,22 @@ def class_state_transition(state: int, state_type: StateType) -> Callable:
     return wrapper
 
 
+def event_key(state: int, state_type: int) -> int:
+    """Packs a state and a state type into a single integer to be used as the key for the handlers
+    The state type is either 1 (enter) or 2 (leave) so it fits in the lowest two bits
+    :param state: int: The state of the event
+    :param state_type: int: The type of the event
+    :meta private:
+    """
+    return (state << 2) | state_type
+
+
 class EventHandler(object):
     """The class that neatly handles event callbacks"""
 
     def __init__(self):
-        self.handlers: Dict[Tuple[int, StateType], List[Callable]] = {}
+        # The handlers keyed by the packed state and state type, see event_key
+        self.handlers: Dict[int, List[Callable]] = {}
 
     def change_class_callbacks(self, cls: Any, add: bool = True) -> None:
         """The function that is used to change class callbacks
@@ -54,56 +72,62 @@ class EventHandler(object):
                 else:
                     self.remove_event(state, state_type, method)
 
-    def remove_event(self, state: State, state_type: StateType, func: Callable) -> None:
+    def remove_event(self, state: int, state_type: int, func: Callable) -> None:
         """Removes an event
-        :param state: State: The state to remove the event for
-        :param state_type: StateType: The state type to remove the event for
+        :param state: int: The state to remove the event for
+        :param state_type: int: The state type to remove the event for
         :param func: Callable: The function that needs to be removed from the event
         :meta private:
         """
-        for key, values in self.handlers.copy().items():
-            if key == (state, state_type):
-                values.remove(func)
-                if not values:
-                    del self.handlers[key]
-                else:
-                    self.handlers[key] = values
-
-    def add_event(self, state: State, state_type: StateType, func: Callable) -> None:
+        key = event_key(state, state_type)
+        values = self.handlers.get(key)
+        if values is None:
+            return
+        values.remove(func)
+        if not values:
+            del self.handlers[key]
+
+    def add_event(self, state: int, state_type: int, func: Callable) -> None:
         """Adds an event
-        :param state: State: The state to add the event for
-        :param state_type: StateType: The state type to add the event for
+        :param state: int: The state to add the event for
+        :param state_type: int: The state type to add the event for
         :param func: Callable: The function that needs to be added to the event
         :meta private:
         """
-        if (state, state_type) not in self.handlers:
-            self.handlers[(state, state_type)] = []
-        self.handlers[(state, state_type)].append(func)
+        key = event_key(state, state_type)
+        if key not in self.handlers:
+            self.handlers[key] = []
+        self.handlers[key].append(func)
 
-    def run_state(self, state: State, other_state: State, state_type: StateType, data: str) -> bool:
+    def run_state(self, state: int, other_state: int, state_type: int, data: str) -> bool:
         """The function that runs the callback for a specific event
-        :param state: State: The state of the event
-        :param other_state: State: The other state of the event
-        :param state_type: StateType: The state type of the event
+        :param state: int: The state of the event
+        :param other_state: int: The other state of the event, converted to a State only if a callback is ran
+        :param state_type: int: The state type of the event
         :param data: str: The data that gets passed to the function callback when the event is ran
         :meta private:
         """
-        if (state, state_type) not in self.handlers:
+        funcs = self.handlers.get(event_key(state, state_type))
+        if not funcs:
             return False
-        for func in self.handlers[(state, state_type)]:
-            func(other_state, data)
+        other = STATES[other_state]
+        for func in funcs:
+            func(other, data)
         return True
 
-    def run(self, old_state: State, new_state: State, data: Any) -> bool:
+    def run(self, old_state: int, new_state: int, data: Any) -> bool:
         """Run a specific event.
         It converts the data and then runs the event for all state types
-        :param old_state: State: The previous state for running the event
-        :param new_state: State: The new state for running the event
+        :param old_state: int: The previous state for running the event
+        :param new_state: int: The new state for running the event
         :param data: Any: The data that gets passed to the event
         :param convert: bool:  (Default value = True): Whether or not to convert the data further
         """
+        # Nothing is registered, skip looking up both transitions
+        if not self.handlers:
+            return False
         # First run leave transitions, then enter
-        self.run_state(old_state, new_state, StateType.LEAVE, data)
+        self.run_state(old_state, new_state, STATE_TYPE_LEAVE, data)
         # We decide handled based on enter transitions
-        handled = self.run_state(new_state, old_state, StateType.ENTER, data)
+        handled = self.run_state(new_state, old_state, STATE_TYPE_ENTER, data)
         return handled
@@ -1,5 +1,6 @@
 import pathlib
 from ctypes import CDLL, POINTER, c_char_p, c_int, c_longlong, c_void_p, cdll
+from functools import lru_cache
 
 from eduvpn_common import __version__
 from eduvpn_common.types import (
@@ -13,6 +14,9 @@ from eduvpn_common.types import (
     VPNStateChange,
 )
 
+# The name of the Go shared library, it only depends on the version so compute it once
+LIBFILE = f"libeduvpn_common-{__version__}.so"
+
 
 def load_lib() -> CDLL:
     """The function that loads the Go shared library
@@ -22,17 +26,32 @@ def load_lib() -> CDLL:
     :return: The Go shared library loaded with cdll.LoadLibrary from ctypes
     :rtype: CDLL
     """
-    libfile = f"libeduvpn_common-{__version__}.so"
-
     lib = None
 
+    # Load with cdll and not pydll, cdll releases the GIL during every call into Go
+    # such that other Python threads keep running while e.g. the configuration is obtained
     # Try to load in the normal path
     try:
-        lib = cdll.LoadLibrary(libfile)
+        lib = cdll.LoadLibrary(LIBFILE)
         # Otherwise, library should have been copied to the lib/ folder
     except Exception:
-        lib = cdll.LoadLibrary(str(pathlib.Path(__file__).parent / "lib" / libfile))
+        lib = cdll.LoadLibrary(str(pathlib.Path(__file__).parent / "lib" / LIBFILE))
+
+    return lib
+
+
+@lru_cache(maxsize=None)
+def get_lib() -> CDLL:
+    """Loads the Go shared library and initializes its functions.
+    This is only done once, further calls return the same library with its functions already bound
 
+    :meta private:
+
+    :return: The initialized Go shared library
+    :rtype: CDLL
+    """
+    lib = load_lib()
+    initialize_functions(lib)
     return lib
 
 
@@ -46,7 +65,7 @@ def initialize_functions(lib: CDLL) -> None:
     # Exposed functions
     # We have to use c_void_p instead of c_char_p to free it properly
     # See https://stackoverflow.com/questions/13445568/python-ctypes-how-to-free-memory-getting-invalid-pointer-error
-    lib.Deregister.argtypes, lib.Deregister.restype = [], None
+    lib.Deregister.argtypes, lib.Deregister.restype = [], c_void_p
     lib.ExpiryTimes.argtypes, lib.ExpiryTimes.restype = [], DataError
     lib.FreeString.argtypes, lib.FreeString.restype = [c_void_p], None
     lib.DiscoOrganizations.argtypes, lib.DiscoOrganizations.restype = [c_int, c_char_p], DataError
@@ -68,7 +87,7 @@ def initialize_functions(lib: CDLL) -> None:
             c_char_p,
             POINTER(c_longlong),
         ],
-        c_char_p,
+        c_void_p,
     )
     lib.CurrentServer.argtypes, lib.CurrentServer.restype = [], DataError
     lib.RemoveServer.argtypes, lib.RemoveServer.restype = (
@@ -76,7 +95,7 @@ def initialize_functions(lib: CDLL) -> None:
             c_int,
             c_char_p,
         ],
-        c_char_p,
+        c_void_p,
     )
     lib.ServerList.argtypes, lib.ServerList.restype = [], DataError
     lib.Register.argtypes, lib.Register.restype = (
@@ -4,7 +4,7 @@ from enum import IntEnum
 from typing import Any, Callable, Iterator, Optional
 
 from eduvpn_common.event import EventHandler
-from eduvpn_common.loader import initialize_functions, load_lib
+from eduvpn_common.loader import get_lib
 from eduvpn_common.state import State
 from eduvpn_common.types import (
     ProxyReady,
@@ -42,13 +42,15 @@ class ServerType(IntEnum):
     CUSTOM = 3
 
     def __str__(self) -> str:
-        if self == ServerType.INSTITUTE_ACCESS:
-            return "Institute Access Server"
-        if self == ServerType.CUSTOM:
-            return "Custom Server"
-        if self == ServerType.SECURE_INTERNET:
-            return "Secure Internet Server"
-        return "Unknown Server"
+        return SERVER_TYPE_NAMES.get(self, "Unknown Server")
+
+
+# The human readable names of the server types
+SERVER_TYPE_NAMES = {
+    ServerType.INSTITUTE_ACCESS: "Institute Access Server",
+    ServerType.SECURE_INTERNET: "Secure Internet Server",
+    ServerType.CUSTOM: "Custom Server",
+}
 
 
 class Jar(object):
@@ -88,14 +90,21 @@ class EduVPN(object):
         self.token_getter = None
         self.event_handler = EventHandler()
 
-        # Load the library
-        self.lib = load_lib()
-        initialize_functions(self.lib)
+        # Load the library, this is only done once for all instances
+        self.lib = get_lib()
 
     def register_class_callbacks(self, _class):
+        """Register the callbacks of an object or class that are decorated with class_state_transition
+
+        :param _class: The object or class to register the callbacks for
+        """
         self.event_handler.change_class_callbacks(_class, add=True)
 
     def deregister_class_callbacks(self, _class):
+        """Deregister the callbacks of an object or class that were registered with register_class_callbacks
+
+        :param _class: The object or class to deregister the callbacks for
+        """
         self.event_handler.change_class_callbacks(_class, add=False)
 
     def go_cookie_function(self, func: Any, *args: Iterator) -> Any:
@@ -115,15 +124,19 @@ class EduVPN(object):
 
         :meta private:
         """
-        # The functions all have at least one arg type which is the name of the client
-        args_gen = encode_args(list(args), func.argtypes)
-        res = func(*(args_gen))
+        # Functions without arguments, e.g. ServerList, have nothing to encode
+        if args:
+            res = func(*encode_args(args, func.argtypes))
+        else:
+            res = func()
         return decode_res(func.restype)(self.lib, res)
 
     def deregister(self) -> None:
         """Deregister the Go shared library.
         This removes the object from internal bookkeeping and saves the configuration
         """
+        # The error is decoded so that the Go string is freed, but it is discarded on purpose
+        # Deregistering should always clean up the Python side, even if saving the configuration failed
         self.go_function(self.lib.Deregister)
         global global_object
         global_object = None
@@ -239,9 +252,6 @@ class EduVPN(object):
         :return: The configuration and configuration type ('openvpn' or 'wireguard') as a JSON string
         :rtype: str
         """
-        # Because it could be the case that a profile callback is started, store a threading event
-        # In the constructor, we have defined a wait event for Ask_Profile, this waits for this event to be set
-        # The event is set in self.set_profile
         config, config_err = self.go_cookie_function(
             self.lib.GetConfig,
             int(_type),
@@ -277,8 +287,6 @@ class EduVPN(object):
         # Set the profile id
         profile_err = self.go_function(self.lib.SetProfileID, profile_id)
 
-        # If there is a profile event, set it so that the wait callback finishes
-        # And so that the Go code can move to the next state
         if profile_err:
             forwardError(profile_err)
 
@@ -293,8 +301,6 @@ class EduVPN(object):
         # Set the location by country code
         location_err = self.go_function(self.lib.SetSecureLocation, org_id, country_code)
 
-        # If there is a location event, set it so that the wait callback finishes
-        # And so that the Go code can move to the next state
         if location_err:
             forwardError(location_err)
 
@@ -399,7 +405,8 @@ def state_callback(old_state: int, new_state: int, data: str) -> int:
     global global_object
     if global_object is None:
         return 0
-    handled = global_object.event_handler.run(State(old_state), State(new_state), data.decode("utf-8"))
+    # The states are passed as ints, the event handler only converts them when a callback is ran
+    handled = global_object.event_handler.run(old_state, new_state, data.decode("utf-8"))
     if handled:
         return 1
     return 0
@@ -11,9 +11,9 @@ from ctypes import (
     c_size_t,
     c_ulonglong,
     c_void_p,
-    cast,
+    string_at,
 )
-from typing import Any, Iterator, List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Tuple
 
 
 class DataError(Structure):
@@ -49,44 +49,33 @@ def conv_longlongp(val: Optional[int]) -> POINTER(c_longlong):
     return byref(c_longlong(val))
 
 
-def encode_args(args: List[Any], types: List[Any]) -> Iterator[Any]:
+# The argument types that need converting before they can be passed to the Go library
+encode_map = {
+    # c_char_p needs the str to be encoded to bytes
+    c_char_p: lambda x: x.encode("utf-8"),
+    POINTER(c_longlong): conv_longlongp,
+}
+
+
+def encode_args(args: Sequence[Any], types: List[Any]) -> List[Any]:
     """Encode the arguments ready to be used by the Go library
 
-    :param args: List[Any]: The list of arguments
+    :param args: Sequence[Any]: The arguments
     :param types: List[Any]: The list of the types of the arguments
 
     :meta private:
 
-    :return: The arg generator
-    :rtype: Iterator[Any]
+    :return: The encoded arguments
+    :rtype: List[Any]
     """
+    encoded = []
     for arg, t in zip(args, types):
-        # c_char_p needs the str to be encoded to bytes
-        encode_map = {
-            c_char_p: lambda x: x.encode("utf-8"),
-            POINTER(c_longlong): conv_longlongp,
-        }
-        if t in encode_map:
-            arg = encode_map[t](arg)
-        yield arg
-
-
-def decode_res(res: Any) -> Any:
-    """Decode a result as obtained by the Go library
-
-    :param res: Any: The result
-
-    :meta private:
-
-    :return: The argument decoded
-    :rtype: Any
-    """
-    decode_map = {
-        c_void_p: get_ptr_string,
-        DataError: get_data_error,
-        BoolError: get_bool_error,
-    }
-    return decode_map.get(res, lambda lib, x: x)
+        # Other types, e.g. c_int for bools and ints, are converted by ctypes itself
+        convert = encode_map.get(t)
+        if convert is not None:
+            arg = convert(arg)
+        encoded.append(arg)
+    return encoded
 
 
 def get_ptr_string(lib: CDLL, ptr: c_void_p) -> str:
@@ -102,7 +91,7 @@ def get_ptr_string(lib: CDLL, ptr: c_void_p) -> str:
     :rtype: str
     """
     if ptr:
-        string = cast(ptr, c_char_p).value
+        string = string_at(ptr)
         lib.FreeString(ptr)
         if string:
             return string.decode("utf-8")
@@ -136,20 +125,42 @@ def get_bool_error(lib: CDLL, bool_error: BoolError) -> Tuple[bool, str]:
     :return: The bool and error
     :rtype: Tuple[bool, str]
     """
-    boolean = get_bool(lib, bool_error.boolean)
+    # ctypes already gives the c_int as a Python int, non-zero means 'True'
+    boolean = bool_error.boolean != 0
     error = get_ptr_string(lib, bool_error.error)
     return boolean, error
 
 
-def get_bool(lib: CDLL, boolInt: c_int) -> bool:
-    """Get a bool from the Go shared library. Essentially just checking if an int represents 'True'
+def get_as_is(lib: CDLL, res: Any) -> Any:
+    """Return a result as obtained by the Go library without decoding it
 
     :param lib: CDLL: The Go shared library
-    :param boolInt: c_int: The C integer that needs to be converted to the Python bool
+    :param res: Any: The result
 
     :meta private:
 
-    :return: The boolean converted to Python
-    :rtype: bool
+    :return: The result
+    :rtype: Any
+    """
+    return res
+
+
+# The result types that need decoding after being returned by the Go library
+decode_map = {
+    c_void_p: get_ptr_string,
+    DataError: get_data_error,
+    BoolError: get_bool_error,
+}
+
+
+def decode_res(res: Any) -> Any:
+    """Decode a result as obtained by the Go library
+
+    :param res: Any: The result
+
+    :meta private:
+
+    :return: The argument decoded
+    :rtype: Any
     """
-    return int(boolInt) != 0
+    return decode_map.get(res, get_as_is)
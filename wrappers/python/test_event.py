@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+import unittest
+
+import eduvpn_common.event as event
+from eduvpn_common.state import State, StateType
+
+
+class Handler:
+    def __init__(self):
+        self.calls = []
+
+    @event.class_state_transition(State.OAUTH_STARTED, StateType.ENTER)
+    def on_oauth(self, old_state: State, data: str):
+        self.calls.append(("enter", old_state, data))
+
+    @event.class_state_transition(State.MAIN, StateType.LEAVE)
+    def on_leave_main(self, old_state: State, data: str):
+        self.calls.append(("leave", old_state, data))
+
+
+@event.class_state_transition(State.MAIN, StateType.ENTER)
+def on_main(old_state: State, data: str):
+    on_main.calls.append(old_state)
+
+
+on_main.calls = []
+
+
+class SlotsHandler:
+    __slots__ = ("on_main",)
+
+    def __init__(self):
+        self.on_main = on_main
+
+
+class PropertyHandler:
+    @property
+    def on_main(self):
+        return on_main
+
+
+class EventTests(unittest.TestCase):
+    def setUp(self):
+        on_main.calls.clear()
+
+    def testEventKeyUnique(self):
+        # The state and state type are packed into one int, these must never collide
+        keys = {event.event_key(state, state_type) for state in State for state_type in StateType}
+        self.assertEqual(len(keys), len(State) * len(StateType))
+
+    def testClassCallbacks(self):
+        handler = Handler()
+        event_handler = event.EventHandler()
+        event_handler.change_class_callbacks(handler)
+
+        self.assertTrue(event_handler.run(State.MAIN, State.OAUTH_STARTED, "data"))
+        self.assertEqual(
+            handler.calls,
+            [
+                ("leave", State.OAUTH_STARTED, "data"),
+                ("enter", State.MAIN, "data"),
+            ],
+        )
+        # The other state is given as a State, also when the states are passed as ints
+        self.assertIs(handler.calls[0][1], State.OAUTH_STARTED)
+
+        # No enter transition is registered for main
+        self.assertFalse(event_handler.run(State.OAUTH_STARTED, State.MAIN, "data"))
+
+        event_handler.change_class_callbacks(handler, add=False)
+        self.assertEqual(event_handler.handlers, {})
+        self.assertFalse(event_handler.run(State.MAIN, State.OAUTH_STARTED, "data"))
+
+    def testInstanceCallbacks(self):
+        calls = []
+
+        @event.class_state_transition(State.MAIN, StateType.ENTER)
+        def on_main(old_state: State, data: str):
+            calls.append(old_state)
+
+        handler = Handler()
+        handler.on_main = on_main
+        event_handler = event.EventHandler()
+        event_handler.change_class_callbacks(handler)
+        self.assertTrue(event_handler.run(State.DEREGISTERED, State.MAIN, "{}"))
+        self.assertEqual(calls, [State.DEREGISTERED])
+
+        # An object without the instance callback only gets the class callbacks
+        other = Handler()
+        other_handler = event.EventHandler()
+        other_handler.change_class_callbacks(other)
+        self.assertFalse(other_handler.run(State.DEREGISTERED, State.MAIN, "{}"))
+
+        event_handler.change_class_callbacks(handler, add=False)
+        self.assertEqual(event_handler.handlers, {})
+
+    def testSlotsCallbacks(self):
+        handler = SlotsHandler()
+        event_handler = event.EventHandler()
+        event_handler.change_class_callbacks(handler)
+        self.assertTrue(event_handler.run(State.DEREGISTERED, State.MAIN, "{}"))
+        self.assertEqual(on_main.calls, [State.DEREGISTERED])
+
+        event_handler.change_class_callbacks(handler, add=False)
+        self.assertEqual(event_handler.handlers, {})
+
+    def testPropertyCallbacks(self):
+        handler = PropertyHandler()
+        event_handler = event.EventHandler()
+        event_handler.change_class_callbacks(handler)
+        self.assertTrue(event_handler.run(State.DEREGISTERED, State.MAIN, "{}"))
+        self.assertEqual(on_main.calls, [State.DEREGISTERED])
+
+        event_handler.change_class_callbacks(handler, add=False)
+        self.assertEqual(event_handler.handlers, {})
+
+    def testCallbacksAddedLater(self):
+        class Later:
+            pass
+
+        event_handler = event.EventHandler()
+        event_handler.change_class_callbacks(Later())
+        self.assertEqual(event_handler.handlers, {})
+
+        # A callback added to the class after a registration is still found
+        Later.on_main = staticmethod(on_main)
+        event_handler.change_class_callbacks(Later())
+        self.assertTrue(event_handler.run(State.DEREGISTERED, State.MAIN, "{}"))
+        self.assertEqual(on_main.calls, [State.DEREGISTERED])
+
+
+if __name__ == "__main__":
+    unittest.main()